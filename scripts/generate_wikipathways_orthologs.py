@@ -3,7 +3,8 @@
 """Generate orthologous relations between WikiPathways."""
 
 import itertools as itt
-from typing import Iterable
+from collections import defaultdict
+from typing import DefaultDict, Iterable, List
 
 import pyobo
 from gilda.process import normalize
@@ -13,39 +14,36 @@ from biomappings.resources import PredictionTuple, append_prediction_tuples
 from biomappings.utils import get_script_url
 
 
-def _lexical_exact_match(name1: str, name2: str) -> bool:
-    return normalize(name1) == normalize(name2)
-
-
 def iterate_orthologous_lexical_matches(prefix: str = "wikipathways") -> Iterable[PredictionTuple]:
     """Generate orthologous relations between lexical matches from different species."""
     names = pyobo.get_id_name_mapping(prefix)
     species = pyobo.get_id_species_mapping(prefix)
     provenance = get_script_url(__file__)
 
+    # Only pathways whose names normalize to the same string can be lexical
+    # matches, so group them up front instead of comparing all pairs of pathways
+    identifiers_by_name: DefaultDict[str, List[str]] = defaultdict(list)
+    for identifier, name in names.items():
+        identifiers_by_name[normalize(name)].append(identifier)
+
     count = 0
-    it = itt.combinations(sorted(names.items()), 2)
-    it = tqdm(
-        it,
+    for identifiers in tqdm(
+        identifiers_by_name.values(),
         unit_scale=True,
-        unit="pair",
-        total=len(names) * (len(names) - 1) / 2,
-    )
-    for (source_id, source_name), (target_id, target_name) in sorted(it):
-        source_species = species[source_id]
-        target_species = species[target_id]
-        if source_species == target_species:
-            continue
-        if _lexical_exact_match(source_name, target_name):
+        unit="name",
+    ):
+        for source_id, target_id in itt.combinations(sorted(identifiers), 2):
+            if species[source_id] == species[target_id]:
+                continue
             count += 1
             yield PredictionTuple(
                 prefix,
                 source_id,
-                source_name,
+                names[source_id],
                 "RO:HOM0000017",
                 prefix,
                 target_id,
-                target_name,
+                names[target_id],
                 "semapv:LexicalMatching",
                 0.95,
                 provenance,
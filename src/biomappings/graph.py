@@ -15,7 +15,12 @@ import yaml
 from bioregistry.resolve_identifier import get_bioregistry_iri
 from tqdm import tqdm
 
-from biomappings.resources import load_false_mappings, load_mappings, load_predictions
+from biomappings.resources import (
+    FALSE_MAPPINGS_PATH,
+    PREDICTIONS_PATH,
+    TRUE_MAPPINGS_PATH,
+    _load_table_shared,
+)
 from biomappings.utils import DATA, IMG, get_curie
 
 logger = logging.getLogger(__name__)
@@ -25,7 +30,9 @@ def get_true_graph(
     include: Optional[Sequence[str]] = None, exclude: Optional[Sequence[str]] = None
 ) -> nx.Graph:
     """Get a graph of the true mappings."""
-    return _graph_from_mappings(load_mappings(), strata="correct", include=include, exclude=exclude)
+    return _graph_from_mappings(
+        _load_table_shared(TRUE_MAPPINGS_PATH), strata="correct", include=include, exclude=exclude
+    )
 
 
 def get_false_graph(
@@ -33,7 +40,10 @@ def get_false_graph(
 ) -> nx.Graph:
     """Get a graph of the false mappings."""
     return _graph_from_mappings(
-        load_false_mappings(), strata="incorrect", include=include, exclude=exclude
+        _load_table_shared(FALSE_MAPPINGS_PATH),
+        strata="incorrect",
+        include=include,
+        exclude=exclude,
     )
 
 
@@ -42,7 +52,7 @@ def get_predictions_graph(
 ) -> nx.Graph:
     """Get a graph of the predicted mappings."""
     return _graph_from_mappings(
-        load_predictions(), strata="predicted", include=include, exclude=exclude
+        _load_table_shared(PREDICTIONS_PATH), strata="predicted", include=include, exclude=exclude
     )
 
 
@@ -55,41 +65,61 @@ def _graph_from_mappings(
     graph = nx.Graph()
 
     if include is not None:
-        include = set(include)
+        include = frozenset(include)
         logger.info("only including %s", include)
     if exclude is not None:
-        exclude = set(exclude)
+        exclude = frozenset(exclude)
         logger.info("excluding %s", exclude)
 
-    for mapping in mappings:
-        relation = mapping["relation"]
-        if exclude and (relation in exclude):
-            continue
-        if include and (relation not in include):
-            continue
-
-        source_curie = get_curie(mapping["source prefix"], mapping["source identifier"])
-        graph.add_node(
-            source_curie,
-            prefix=mapping["source prefix"],
-            identifier=mapping["source identifier"],
-            name=mapping["source name"],
-        )
-        target_curie = get_curie(mapping["target prefix"], mapping["target identifier"])
-        graph.add_node(
-            target_curie,
-            prefix=mapping["target prefix"],
-            identifier=mapping["target identifier"],
-            name=mapping["target name"],
+    # relations are plain strings, so both filters collapse to a single set lookup per mapping
+    if include:
+        include = include.difference(exclude or ())
+        mappings = (mapping for mapping in mappings if mapping["relation"] in include)
+    elif exclude:
+        mappings = (mapping for mapping in mappings if mapping["relation"] not in exclude)
+    mappings = list(mappings)
+
+    source_curies = [
+        get_curie(mapping["source prefix"], mapping["source identifier"]) for mapping in mappings
+    ]
+    target_curies = [
+        get_curie(mapping["target prefix"], mapping["target identifier"]) for mapping in mappings
+    ]
+    graph.add_nodes_from(
+        node
+        for source_curie, target_curie, mapping in zip(source_curies, target_curies, mappings)
+        for node in (
+            (
+                source_curie,
+                {
+                    "prefix": mapping["source prefix"],
+                    "identifier": mapping["source identifier"],
+                    "name": mapping["source name"],
+                },
+            ),
+            (
+                target_curie,
+                {
+                    "prefix": mapping["target prefix"],
+                    "identifier": mapping["target identifier"],
+                    "name": mapping["target name"],
+                },
+            ),
         )
-        graph.add_edge(
+    )
+    graph.add_edges_from(
+        (
             source_curie,
             target_curie,
-            relation=relation,
-            provenance=mapping["source"],
-            type=mapping["type"],
-            strata=strata,
+            {
+                "relation": mapping["relation"],
+                "provenance": mapping["source"],
+                "type": mapping["type"],
+                "strata": strata,
+            },
         )
+        for source_curie, target_curie, mapping in zip(source_curies, target_curies, mappings)
+    )
     return graph
 
 
@@ -99,11 +129,11 @@ def charts():
     import matplotlib.pyplot as plt
     import seaborn as sns
 
-    true_mappings = load_mappings()
+    true_mappings = _load_table_shared(TRUE_MAPPINGS_PATH)
     true_graph = _graph_from_mappings(true_mappings, include=["skos:exactMatch"], strata="correct")
     for u, v in true_graph.edges():
         true_graph.edges[u, v]["correct"] = True
-    false_mappings = load_false_mappings()
+    false_mappings = _load_table_shared(FALSE_MAPPINGS_PATH)
     false_graph = _graph_from_mappings(
         false_mappings, include=["skos:exactMatch"], strata="incorrect"
     )
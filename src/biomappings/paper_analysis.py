@@ -1,24 +1,36 @@
 """Code for the paper analysis."""
 
+import ftplib
+import gzip
 import json
 import pickle
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import DefaultDict, Dict, Iterable, Mapping, Tuple
+from typing import (
+    BinaryIO,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
-import bioontologies
 import bioregistry
-import pyobo
 import pystow
-from bioontologies.obograph import _parse_uri_or_curie_or_str
-from bioregistry import manager
-from tabulate import tabulate
+from bioregistry import Resource, manager
 from tqdm.auto import tqdm
+from typing_extensions import Literal
 
 __all__ = [
     "Result",
     "get_primary_mappings",
+    "get_primary_mappings_for_prefix",
     "get_obo_mappings",
     "get_non_obo_mappings",
     "index_mappings",
@@ -73,27 +85,25 @@ class Result:
         biomappings_prediction_identifiers,
     ):
         """Create a value added summary object with analysis over several dictionaries."""
+        # each level of missing identifiers is a subset of the previous one,
+        # so subtract incrementally instead of starting over from the full datasource
+        missing = datasource_identifiers - ontology_external_identifiers
+        missing_biomappings = missing - biomappings_external_identifiers
+        missing_predictions = missing_biomappings - biomappings_prediction_identifiers
         return Result(
             dataset=dataset,
             source=source,
             target=target,
             total=len(datasource_identifiers),
-            missing=len(datasource_identifiers - ontology_external_identifiers),
-            missing_biomappings=len(
-                datasource_identifiers
-                - ontology_external_identifiers
-                - biomappings_external_identifiers
-            ),
-            missing_predictions=len(
-                datasource_identifiers
-                - ontology_external_identifiers
-                - biomappings_external_identifiers
-                - biomappings_prediction_identifiers
-            ),
+            missing=len(missing),
+            missing_biomappings=len(missing_biomappings),
+            missing_predictions=len(missing_predictions),
         )
 
     def print(self):  # noqa:T202
         """Print a summary of value added statistics."""
+        from tabulate import tabulate
+
         print(  # noqa:T201
             tabulate(
                 [
@@ -123,66 +133,269 @@ def get_primary_mappings(
     prefix: str,
     external_prefix: str,
     cache_path: Path,
+    *,
+    force: bool = False,
 ) -> Tuple[str, Mapping[str, str]]:
     """Get mappings from a given ontology (prefix) to another resource (external prefix)."""
-    if cache_path.is_file():
-        d = json.loads(cache_path.read_text())
-        return d["version"], d["mappings"]
+    return get_primary_mappings_for_prefix(prefix, {external_prefix: cache_path}, force=force)[
+        external_prefix
+    ]
 
-    parse_results = bioontologies.get_obograph_by_prefix(prefix)
-    version = parse_results.guess_version(prefix)
-    graphs = parse_results.graph_document.graphs if parse_results.graph_document else []
-    rv: Dict[str, str] = {}
+
+def get_primary_mappings_for_prefix(
+    prefix: str,
+    cache_paths: Mapping[str, Path],
+    *,
+    force: bool = False,
+) -> Dict[str, Tuple[str, Mapping[str, str]]]:
+    """Get mappings from a given ontology (prefix) to several other resources.
+
+    :param prefix: The prefix for the ontology
+    :param cache_paths: A dictionary from external prefixes to the paths where the
+        mappings to each are cached
+    :param force: Parse the ontology and extract the mappings again, even if
+        they're already cached
+    :returns: A dictionary from external prefixes to pairs of the ontology's version
+        and the mappings from the external resource's identifiers to the ontology's
+
+    The ontology is parsed at most once, and only if the mappings to at least one of
+    the external prefixes are not already cached.
+    """
+    rv: Dict[str, Tuple[str, Mapping[str, str]]] = {}
+    missing: Dict[str, Path] = {}
+    for external_prefix, cache_path in cache_paths.items():
+        if cache_path.is_file() and not force:
+            d = _json_loads(cache_path.read_bytes())
+            rv[external_prefix] = d["version"], d["mappings"]
+        else:
+            missing[external_prefix] = cache_path
+    if not missing:
+        return rv
+
+    from bioontologies.obograph import _parse_uri_or_curie_or_str
+
+    version, graph_document = _get_graph_document(prefix, force=force)
+    graphs = graph_document.graphs if graph_document else []
+    external_resources = {
+        external_prefix: manager.registry[external_prefix] for external_prefix in missing
+    }
+    mappings: Dict[str, Dict[str, str]] = {external_prefix: {} for external_prefix in missing}
     for graph in graphs:
         for node in tqdm(
             graph.nodes,
             unit="node",
             unit_scale=True,
             leave=False,
-            desc=f"Extracting {external_prefix} from {prefix}",
+            desc=f"Extracting {', '.join(missing)} from {prefix}",
         ):
+            # many nodes have no xrefs at all, so check before parsing the node's URI
+            if not node.xrefs:
+                continue
             try:
                 node_prefix, node_luid = _parse_uri_or_curie_or_str(node.id)
             except ValueError:
                 continue
 
-            if node_prefix is None or bioregistry.normalize_prefix(node_prefix) != prefix:
+            if node_prefix is None or _normalize_prefix(node_prefix) != prefix:
                 continue
 
+            # this is equivalent to bioregistry.parse_curie, but only standardizes
+            # the identifier after checking the xref is to one of the external prefixes
             for xref in node.xrefs:
-                xref_prefix, xref_luid = bioregistry.parse_curie(xref.val)
-                if xref_prefix != external_prefix:
+                raw_xref_prefix, delimiter, xref_luid = xref.val.partition(":")
+                if not delimiter:
                     continue
-                rv[xref_luid] = node_luid
-
-    d = {"mappings": rv, "version": version}
-    cache_path.write_text(json.dumps(d, indent=2, sort_keys=True))
-    return version, rv
-
+                xref_prefix = _normalize_prefix(raw_xref_prefix)
+                if xref_prefix is None:
+                    continue
+                external_resource = external_resources.get(xref_prefix)
+                if external_resource is None:
+                    continue
+                xref_luid = external_resource.standardize_identifier(xref_luid)
+                mappings[xref_prefix][xref_luid] = node_luid
+
+    for external_prefix, cache_path in missing.items():
+        d = {"mappings": mappings[external_prefix], "version": version}
+        cache_path.write_bytes(_json_dumps(d))
+        rv[external_prefix] = version, mappings[external_prefix]
+    return rv
+
+
+def _get_graph_document(prefix: str, *, force: bool = False):
+    """Get the version and OBO Graph document for an ontology.
+
+    Parsing an ontology is by far the slowest part of getting its primary mappings,
+    so the parsed document is pickled and reused in later sessions. If :mod:`bioversions`
+    is installed, a cached document that's more than a day old is checked against the
+    ontology's current version, which needs the network, and is parsed again if it changed.
+
+    :param prefix: The prefix for the ontology
+    :param force: Parse the ontology even if it's already cached
+    :returns: A pair of the ontology's version and its OBO Graph document
+    """
+    path = EVALUATION.join("graphs", name=f"{prefix}.pkl")
+    if path.is_file() and not force:
+        with path.open("rb") as file:
+            # the current version is pickled separately before the document, so an
+            # outdated document never needs to be unpickled
+            cached_version = pickle.load(file)
+            if time.time() - path.stat().st_mtime < _GRAPH_DOCUMENT_MAX_AGE:
+                return pickle.load(file)
+            current_version = _get_current_version(prefix)
+            if current_version is None or cached_version == current_version:
+                # don't check the version again for another day
+                path.touch()
+                return pickle.load(file)
+
+    import bioontologies
 
-def index_mappings(mappings: Iterable[Mapping[str, str]], path=None, force: bool = False):
-    """Create an index of mappings."""
+    parse_results = bioontologies.get_obograph_by_prefix(prefix)
+    version = parse_results.guess_version(prefix)
+    with path.open("wb") as file:
+        pickle.dump(_get_current_version(prefix), file, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(
+            (version, parse_results.graph_document), file, protocol=pickle.HIGHEST_PROTOCOL
+        )
+    return version, parse_results.graph_document
+
+
+#: The number of seconds a cached OBO Graph document is used before checking its version
+_GRAPH_DOCUMENT_MAX_AGE = 24 * 60 * 60
+
+
+def _get_current_version(prefix: str) -> Optional[str]:
+    try:
+        import bioversions
+    except ImportError:
+        return None
+    try:
+        return bioversions.get_version(prefix)
+    # these are the errors bioversions itself skips for unresolvable versions,
+    # plus the KeyError for prefixes it doesn't know
+    except (KeyError, ValueError, IOError, AttributeError, ftplib.error_perm):
+        return None
+
+
+def index_mappings(
+    mappings: Iterable[Mapping[str, str]], path=None, force: bool = False, progress: bool = False
+):
+    """Create an index of mappings.
+
+    :param mappings: The mappings to index
+    :param path: An optional path where the index is cached. Paths ending with ``.zst``
+        are written as zstandard-compressed JSON (requires :mod:`zstandard`), which loads
+        faster than a pickle for large indexes. All other paths are pickled, and gzipped
+        if they end with ``.gz``.
+    :param force: Rebuild the index even if it's already cached
+    :param progress: Show a progress bar while reading the mappings
+    :returns: A dictionary from prefixes to dictionaries from prefixes to dictionaries
+        from identifiers to identifiers, containing each mapping in both directions
+    """
     if path and path.is_file() and not force:
-        with open(path, "rb") as file:
-            return pickle.load(file)
-
-    rv: DefaultDict[str, DefaultDict[str, Dict[str, str]]] = defaultdict(lambda: defaultdict(dict))
-
-    for mapping in tqdm(mappings, unit_scale=True, unit="mapping"):
-        source_prefix = mapping["source prefix"]
-        source_resource = manager.registry[source_prefix]
+        return _read_index(path)
+
+    # build plain dictionaries directly so the result doesn't need to be
+    # copied out of nested defaultdicts before being returned or pickled
+    rv: Dict[str, Dict[str, Dict[str, str]]] = {}
+    # look up each prefix pair's resources and inner dictionaries once, since an
+    # index only spans a few prefix pairs
+    prefix_pairs: Dict[
+        Tuple[str, str], Tuple[Resource, Resource, Dict[str, str], Dict[str, str]]
+    ] = {}
+    # both directions are set in the same order as the mappings, since later mappings
+    # overwrite earlier ones for one-to-many mappings
+    for mapping in tqdm(mappings, unit_scale=True, unit="mapping", disable=not progress):
+        key = mapping["source prefix"], mapping["target prefix"]
+        prefix_pair = prefix_pairs.get(key)
+        if prefix_pair is None:
+            source_resource = _get_resource(key[0])
+            target_resource = _get_resource(key[1])
+            prefix_pair = prefix_pairs[key] = (
+                source_resource,
+                target_resource,
+                rv.setdefault(source_resource.prefix, {}).setdefault(target_resource.prefix, {}),
+                rv.setdefault(target_resource.prefix, {}).setdefault(source_resource.prefix, {}),
+            )
+        source_resource, target_resource, forward, backward = prefix_pair
         source_id = source_resource.standardize_identifier(mapping["source identifier"])
-        target_prefix = mapping["target prefix"]
-        target_resource = manager.registry[target_prefix]
         target_id = target_resource.standardize_identifier(mapping["target identifier"])
-        rv[source_prefix][target_prefix][source_id] = target_id
-        rv[target_prefix][source_prefix][target_id] = source_id
+        forward[source_id] = target_id
+        backward[target_id] = source_id
 
-    rvp = {k: dict(v) for k, v in rv.items()}
     if path:
-        with open(path, "wb") as file:
-            pickle.dump(rvp, file)
-    return rvp
+        _write_index(path, rv)
+    return rv
+
+
+@lru_cache(maxsize=None)
+def _normalize_prefix(prefix: str) -> Optional[str]:
+    return bioregistry.normalize_prefix(prefix)
+
+
+@lru_cache(maxsize=None)
+def _get_resource(prefix: str) -> Resource:
+    """Get a resource, normalizing the prefix. Memoized since an index only spans a few prefixes."""
+    resource = bioregistry.get_resource(prefix)
+    if resource is None:
+        raise KeyError(f"unregistered prefix: {prefix}")
+    return resource
+
+
+def _json_loads(data: bytes):
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj).encode("utf-8")
+    return orjson.dumps(obj)
+
+
+def _open_pickle(path: Path, mode: Literal["rb", "wb"]) -> BinaryIO:
+    if path.suffix == ".gz":
+        # the index is mostly short repetitive strings, so even the fastest
+        # compression level shrinks it considerably
+        return gzip.open(path, mode, compresslevel=1)  # type: ignore
+    return open(path, mode)
+
+
+def _read_index(path: Path):
+    if path.suffix == ".zst":
+        import zstandard
+
+        return _json_loads(zstandard.ZstdDecompressor().decompress(path.read_bytes()))
+    with _open_pickle(path, "rb") as file:
+        item = pickle.load(file)
+        # indexes cached before streaming was introduced are a single dictionary
+        if isinstance(item, dict):
+            return item
+        rv = {}
+        while item is not None:
+            prefix, value = item
+            rv[prefix] = value
+            item = pickle.load(file)
+        return rv
+
+
+def _write_index(path: Path, index) -> None:
+    if path.suffix == ".zst":
+        import zstandard
+
+        path.write_bytes(zstandard.ZstdCompressor(level=10).compress(_json_dumps(index)))
+        return
+    # write one (prefix, sub-index) pair at a time followed by a None sentinel
+    # so the pickler's memo never has to cover the whole index at once. Each pair
+    # gets its own pickle since the unpickler's memo can't be reset mid-stream
+    with _open_pickle(path, "wb") as file:
+        for item in index.items():
+            pickle.dump(item, file, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(None, file, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 PRIMARY_MAPPING_CONFIG = [
@@ -222,21 +435,62 @@ def _clean_version(version: str, prefix) -> str:
     )
 
 
-def get_obo_mappings(primary_dd, biomappings_dd):
-    """Fill the primary mappings for ontologies and calculate a value added summary."""
+def get_obo_mappings(
+    primary_dd,
+    biomappings_dd,
+    *,
+    max_workers: Optional[int] = 8,
+    processes: bool = False,
+    force: bool = False,
+):
+    """Fill the primary mappings for ontologies and calculate a value added summary.
+
+    Ontologies are downloaded and parsed concurrently. All externals for the same prefix
+    are handled by the same worker so each ontology is only downloaded and parsed once.
+
+    :param primary_dd: A dictionary from external prefixes to dictionaries from
+        ontology prefixes that is filled with the primary mappings
+    :param biomappings_dd: The Biomappings index, as returned by :func:`index_mappings`
+    :param max_workers: The maximum number of workers
+    :param processes: Use a process pool instead of a thread pool, which helps when
+        parsing rather than downloading dominates
+    :param force: Parse the ontologies and extract their mappings again, even if
+        they're already cached
+    :returns: A list of summary rows with the prefix, version, external prefix, number
+        of primary mappings, number of Biomappings mappings, total, and gain
+    """
+    externals_by_prefix: DefaultDict[str, List[str]] = defaultdict(list)
+    for prefix, external, _uri in PRIMARY_MAPPING_CONFIG:
+        externals_by_prefix[prefix].append(external)
+
+    if max_workers is not None:
+        # don't start workers that would never get a prefix
+        max_workers = min(max_workers, len(externals_by_prefix))
+    executor_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_cls(max_workers=max_workers) as executor:
+        futures = {
+            prefix: executor.submit(
+                get_primary_mappings_for_prefix,
+                prefix,
+                {
+                    external: EVALUATION.join("mappings", name=f"{prefix}_{external}.json")
+                    for external in externals
+                },
+                force=force,
+            )
+            for prefix, externals in externals_by_prefix.items()
+        }
+        results = {prefix: future.result() for prefix, future in futures.items()}
+
     summary_rows = []
+    gain: Optional[float]
     for prefix, external, _uri in PRIMARY_MAPPING_CONFIG:
-        cache_path = EVALUATION.join("mappings", name=f"{prefix}_{external}.json")
-        version, primary = get_primary_mappings(prefix, external, cache_path=cache_path)
+        version, primary = results[prefix][external]
         primary_dd[external][prefix] = primary
 
-        primary_set = set(primary)
-        bm = set(biomappings_dd.get(external, {}).get(prefix, {})).union(
-            biomappings_dd.get(prefix, {}).get(external, {})
-        )
-        n_primary = len(primary_set.difference(bm))
-        n_biomappings = len(bm)
-        n_total = len(primary_set.union(bm))
+        n_biomappings, n_overlap = _count_biomappings(biomappings_dd, external, prefix, primary)
+        n_primary = len(primary) - n_overlap
+        n_total = len(primary) + n_biomappings - n_overlap
 
         if not n_primary and n_biomappings:
             gain = float("inf")
@@ -260,6 +514,33 @@ def get_obo_mappings(primary_dd, biomappings_dd):
     return summary_rows
 
 
+def _count_biomappings(
+    biomappings_dd, a: str, b: str, primary: Mapping[str, str]
+) -> Tuple[int, int]:
+    """Count the identifiers mapped in either direction between two prefixes.
+
+    :param biomappings_dd: The Biomappings index, as returned by :func:`index_mappings`
+    :param a: The first prefix
+    :param b: The second prefix
+    :param primary: The primary mappings, keyed by identifiers in ``a``
+    :returns: A pair of the number of identifiers and how many of them are also
+        keys in the primary mappings
+
+    This is equivalent to taking the lengths of the union of both directions' keys and
+    its intersection with the primary mappings' keys, without building any sets.
+    """
+    a_dd, b_dd = biomappings_dd.get(a), biomappings_dd.get(b)
+    a_to_b = (a_dd.get(b) if a_dd else None) or {}
+    b_to_a = (b_dd.get(a) if b_dd else None) or {}
+    n_biomappings = len(a_to_b)
+    n_overlap = sum(key in primary for key in a_to_b)
+    for key in b_to_a:
+        if key not in a_to_b:
+            n_biomappings += 1
+            n_overlap += key in primary
+    return n_biomappings, n_overlap
+
+
 PYOBO_CONFIGS = [
     ("cellosaurus", "efo", "CVCL_", "EFO_"),
     ("cellosaurus", "ccle", "CVCL_", ""),
@@ -269,23 +550,27 @@ PYOBO_CONFIGS = [
 
 def get_non_obo_mappings(primary_dd, biomappings_dd):
     """Fill the primary mappings for non-obo sources calculate a value added summary."""
+    import pyobo
+
     summary_rows = []
     for prefix, external, source_banana, target_banana in PYOBO_CONFIGS:
         xrefs_df = pyobo.get_xrefs_df(prefix)
-        xrefs_slim_df = xrefs_df[xrefs_df["target_ns"] == external]
+        # only copy the two needed columns and strip the bananas column-wise
+        xrefs_slim_df = xrefs_df.loc[
+            xrefs_df["target_ns"] == external, [f"{prefix}_id", "target_id"]
+        ]
 
         version = "unknown"  # FIXME, e.g., with bioversions.get_version(prefix)
-        primary = primary_dd[external][prefix] = {
-            target_id.removeprefix(target_banana): source_id.removeprefix(source_banana)
-            for source_id, target_id in xrefs_slim_df[[f"{prefix}_id", "target_id"]].values
-        }
+        primary = primary_dd[external][prefix] = dict(
+            zip(
+                xrefs_slim_df["target_id"].str.removeprefix(target_banana),
+                xrefs_slim_df[f"{prefix}_id"].str.removeprefix(source_banana),
+            )
+        )
         n_primary = len(primary)
 
-        bm = set(biomappings_dd.get(external, {}).get(prefix, {})).union(
-            biomappings_dd.get(prefix, {}).get(external, {})
-        )
-        n_biomappings = len(bm)
-        n_total = len(set(primary).union(bm))
+        n_biomappings, n_overlap = _count_biomappings(biomappings_dd, external, prefix, primary)
+        n_total = n_primary + n_biomappings - n_overlap
 
         if not n_primary and n_biomappings:
             gain = float("inf")
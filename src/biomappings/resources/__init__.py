@@ -5,19 +5,28 @@
 import csv
 import itertools as itt
 import logging
+import sys
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from stat import S_ISREG
 from typing import (
+    AbstractSet,
     Any,
+    Callable,
     DefaultDict,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
+    TypeVar,
     Union,
 )
 
@@ -83,6 +92,8 @@ PREDICTIONS_HEADER = [
     "confidence",
     "source",
 ]
+_MAPPINGS_CONFIDENCE_INDEX = MAPPINGS_HEADER.index("prediction_confidence")
+_PREDICTIONS_CONFIDENCE_INDEX = PREDICTIONS_HEADER.index("confidence")
 
 
 class MappingTuple(NamedTuple):
@@ -108,12 +119,9 @@ class MappingTuple(NamedTuple):
     @classmethod
     def from_dict(cls, mapping: Mapping[str, str]) -> "MappingTuple":
         """Get the mapping tuple from a dictionary."""
-        values = []
-        for key in MAPPINGS_HEADER:
-            value = mapping.get(key) or None
-            if key == "prediction_confidence" and value is not None:
-                value = float(value)  # type:ignore
-            values.append(value)
+        values = [mapping.get(key) or None for key in MAPPINGS_HEADER]
+        if values[_MAPPINGS_CONFIDENCE_INDEX] is not None:
+            values[_MAPPINGS_CONFIDENCE_INDEX] = float(values[_MAPPINGS_CONFIDENCE_INDEX])  # type:ignore
         return cls(*values)  # type:ignore
 
     @property
@@ -181,24 +189,35 @@ class PredictionTuple(NamedTuple):
     @classmethod
     def from_dict(cls, mapping: Mapping[str, str]) -> "PredictionTuple":
         """Get the prediction tuple from a dictionary."""
-        values = []
-        for key in PREDICTIONS_HEADER:
-            value = mapping.get(key) or None
-            if key == "confidence" and value is not None:
-                value = float(value)  # type:ignore
-            values.append(value)
+        values = [mapping.get(key) or None for key in PREDICTIONS_HEADER]
+        if values[_PREDICTIONS_CONFIDENCE_INDEX] is not None:
+            values[_PREDICTIONS_CONFIDENCE_INDEX] = float(values[_PREDICTIONS_CONFIDENCE_INDEX])  # type:ignore
         return cls(*values)  # type:ignore
 
     @classmethod
-    def from_semra(cls, mapping, confidence) -> "PredictionTuple":
-        """Instantiate from a SeMRA mapping."""
-        import pyobo
+    def from_semra(
+        cls, mapping, confidence, names: Optional[Mapping[str, Mapping[str, str]]] = None
+    ) -> "PredictionTuple":
+        """Instantiate from a SeMRA mapping.
+
+        :param mapping: A SeMRA mapping with a single simple evidence
+        :param confidence: The confidence to assign to the prediction
+        :param names: A dictionary from prefixes to dictionaries from local unique
+            identifiers to names that is checked before falling back to :mod:`pyobo`.
+            Prefixes whose names couldn't be loaded map to empty dictionaries and
+            don't fall back, since looking up a single name would fail the same way.
+        :returns: A prediction tuple
+        :raises KeyError: If the name of the subject or object can't be looked up
+        :raises ValueError: If the mapping doesn't have exactly one evidence or the
+            evidence doesn't have a mapping set
+        :raises TypeError: If the evidence isn't a simple evidence
+        """
         import semra
 
-        s_name = pyobo.get_name(*mapping.s.pair)
+        s_name = _get_name(mapping.s.prefix, mapping.s.identifier, names)
         if not s_name:
             raise KeyError(f"could not look up name for {mapping.s.curie}")
-        o_name = pyobo.get_name(*mapping.o.pair)
+        o_name = _get_name(mapping.o.prefix, mapping.o.identifier, names)
         if not o_name:
             raise KeyError(f"could not look up name for {mapping.o.curie}")
         # Assume that each mapping has a single simple evidence with a mapping set annotation
@@ -232,6 +251,8 @@ class PredictionTuple(NamedTuple):
 
 
 Mappings = Iterable[Mapping[str, str]]
+CanonicalTuple = Tuple[str, str, str, str]
+X = TypeVar("X")
 
 
 def get_resource_file_path(fname) -> Path:
@@ -239,31 +260,194 @@ def get_resource_file_path(fname) -> Path:
     return RESOURCE_PATH.joinpath(fname)
 
 
+#: The rows of each loaded table, along with the modification time and size of the
+#: file when it was read. Only the latest version of each file is kept.
+_TABLE_CACHE: Dict[Path, Tuple[int, int, Tuple[Dict[str, str], ...]]] = {}
+#: The fingerprints of each loaded table's canonical tuples, with the same keys as above
+_FINGERPRINTS_CACHE: Dict[Path, Tuple[int, int, FrozenSet[int]]] = {}
+#: Each loaded table's mappings from source to target identifiers for each pair of source
+#: and target prefixes, with the same keys as above
+_SUBSETS_CACHE: Dict[Path, Tuple[int, int, Dict[Tuple[str, str], Dict[str, str]]]] = {}
+
+
 def _load_table(path: Union[str, Path]) -> List[Dict[str, str]]:
+    """Load a table as a new list of new dictionaries, which can be safely modified."""
+    return [dict(mapping) for mapping in _load_table_shared(path)]
+
+
+def _load_table_shared(path: Union[str, Path]) -> Sequence[Mapping[str, str]]:
+    """Load a table, reusing the previous result if the file hasn't changed since.
+
+    :param path: The path to the table
+    :returns: The table's mappings, which are shared between all callers, so they
+        must not be modified
+    """
+    return _get_cached(_TABLE_CACHE, path, _read_table) or ()
+
+
+def _get_cached(
+    cache: Dict[Path, Tuple[int, int, X]], path: Union[str, Path], func: Callable[[Path], X]
+) -> Optional[X]:
+    """Get something derived from a table, only recalculating it if the file has changed."""
+    key = _get_table_key(path)
+    if key is None:
+        return None
+    path, mtime_ns, size = key
+    cached = cache.get(path)
+    if cached is None or cached[:2] != (mtime_ns, size):
+        cached = cache[path] = mtime_ns, size, func(path)
+    return cached[2]
+
+
+def _get_table_key(path: Union[str, Path]) -> Optional[Tuple[Path, int, int]]:
     path = Path(path).resolve()
-    if not path.is_file():
+    # a single stat() both checks that the file exists and gets its cache key
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        stat = None
+    if stat is None or not S_ISREG(stat.st_mode):
         logger.warning("mappings file does not exist, returning empty list: %s", path)
-        return []
+        return None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _read_table(path: Path) -> Tuple[Dict[str, str], ...]:
     with path.open("r") as fh:
         reader = csv.reader(fh, delimiter="\t")
         header = next(reader)
-        return [_clean(header, row) for row in reader]
+        interned_indexes = [i for i, key in enumerate(header) if key in _INTERNED_COLUMNS]
+        rv = []
+        for row in reader:
+            for i in interned_indexes:
+                # rows can leave off trailing optional columns
+                if i < len(row):
+                    row[i] = sys.intern(row[i])
+            rv.append(_clean(header, row))
+        return tuple(rv)
+
+
+#: Columns with only a few distinct values. Interning them means all rows share the
+#: same string objects, which about halves the memory used by the predictions table
+_INTERNED_COLUMNS = {
+    "source prefix",
+    "relation",
+    "target prefix",
+    "type",
+    "source",
+    "prediction_type",
+    "prediction_source",
+}
+
+
+def _forget_table(path: Union[str, Path]) -> None:
+    path = Path(path).resolve()
+    _TABLE_CACHE.pop(path, None)
+    _FINGERPRINTS_CACHE.pop(path, None)
+    _SUBSETS_CACHE.pop(path, None)
+
+
+def _get_fingerprints(*paths: Union[str, Path]) -> Set[int]:
+    """Get the fingerprints of all mappings in the given tables."""
+    # the cached fingerprints of each table are copied into one new set, since checking a
+    # single set for each mapping is faster than checking each table's set in turn. Adding
+    # to one set avoids chaining unions, which would copy the set again for each table
+    rv: Set[int] = set()
+    for path in paths:
+        fingerprints = _get_cached(_FINGERPRINTS_CACHE, path, _read_fingerprints)
+        if fingerprints is not None:
+            rv.update(fingerprints)
+    return rv
+
+
+def _read_fingerprints(path: Path) -> FrozenSet[int]:
+    # only the four columns that make up the canonical tuple are read, which is about
+    # twice as fast as loading the whole table when only the fingerprints are needed
+    with path.open("r") as fh:
+        reader = csv.reader(fh, delimiter="\t")
+        header = next(reader)
+        getter = itemgetter(*(header.index(key) for key in _CANONICAL_COLUMNS))
+        rv = set()
+        for source_prefix, source_id, target_prefix, target_id in map(getter, reader):
+            # this is the same as get_canonical_tuple(), without building a dictionary
+            source, target = (source_prefix, source_id), (target_prefix, target_id)
+            if source > target:
+                source, target = target, source
+            rv.add(hash((*source, *target)))
+        return frozenset(rv)
+
+
+_CANONICAL_COLUMNS = ("source prefix", "source identifier", "target prefix", "target identifier")
+
+
+def _get_fingerprint(mapping: Mapping[str, str]) -> int:
+    """Get an integer fingerprint of the mapping's canonical tuple.
+
+    :param mapping: A mapping dictionary
+    :returns: The hash of the mapping's canonical tuple. Sets of fingerprints take
+        less memory than sets of canonical tuples and are faster to check. Since
+        they're based on :func:`hash`, they're only valid within the same process
+        and must not be persisted.
+
+    Distinct canonical tuples can share a fingerprint, so removing mappings by
+    fingerprint can drop a mapping that isn't actually in the removed set. With
+    64-bit hashes, this is about as likely as one in :math:`2^{64} / (n m)` when
+    checking :math:`n` mappings against :math:`m` fingerprints. That's accepted when
+    deduplicating the predictions table against the curated tables, but public
+    functions like :func:`remove_mappings` compare exact canonical tuples instead.
+    """
+    return hash(get_canonical_tuple(mapping))
 
 
 def _clean(header, row):
-    d = dict(zip(header, row))
-    return {k: v if v and v != "." else None for k, v in d.items()}
+    return {k: v if v and v != "." else None for k, v in zip(header, row)}
 
 
 def _write_helper(
     header: Sequence[str], mappings: Mappings, path: Union[str, Path], mode: Literal["w", "a"]
-) -> None:
-    mappings = sorted(mappings, key=mapping_sort_key)
+) -> int:
+    """Write the mappings to the file.
+
+    :param header: The columns to write
+    :param mappings: The mappings to write
+    :param path: The path to the table
+    :param mode: Write a new table with ``"w"``, or append to an existing one with
+        ``"a"``. When appending, mappings that would be removed as redundant by linting
+        the file anyway are skipped, and the file isn't touched at all if nothing is
+        left. Appended mappings aren't sorted, since only linting the whole file can
+        put them in order.
+    :returns: The number of mappings written
+    """
+    if mode == "a":
+        mappings = _skip_redundant_appends(mappings, path)
+        if not mappings:
+            return 0
+    else:
+        mappings = sorted(mappings, key=mapping_sort_key)
+    # formatting a whole line at once is about twice as fast as print() with a separator
+    line_format = "\t".join(["{}"] * len(header)) + "\n"
     with open(path, mode) as file:
         if mode == "w":
-            print(*header, sep="\t", file=file)  # noqa:T201
+            file.write(line_format.format(*header))
         for line in mappings:
-            print(*[line[k] or "" for k in header], sep="\t", file=file)  # noqa:T201
+            file.write(line_format.format(*[line[k] or "" for k in header]))
+    # modification times can be too coarse to notice consecutive writes
+    _forget_table(path)
+    return len(mappings)
+
+
+def _skip_redundant_appends(mappings: Mappings, path: Union[str, Path]) -> List[Mapping[str, str]]:
+    existing: Dict[CanonicalTuple, int] = {}
+    for mapping in _load_table_shared(path):
+        key = get_canonical_tuple(mapping)
+        existing[key] = max(existing.get(key, 0), _pick_best(mapping))
+    # since linting keeps the first of equally good mappings, a new mapping only
+    # survives if it's strictly better than what's already in the file
+    return [
+        mapping
+        for mapping in _remove_redundant(mappings)
+        if _pick_best(mapping) > existing.get(get_canonical_tuple(mapping), -1)
+    ]
 
 
 def mapping_sort_key(prediction: Mapping[str, str]) -> Tuple[str, ...]:
@@ -289,11 +473,17 @@ def load_mappings(*, path: Union[str, Path, None] = None) -> List[Dict[str, str]
 
 def load_mappings_subset(source: str, target: str) -> Mapping[str, str]:
     """Get a dictionary of 1-1 mappings from the source prefix to the target prefix."""
-    return {
-        mapping["source identifier"]: mapping["target identifier"]
-        for mapping in load_mappings()
-        if mapping["source prefix"] == source and mapping["target prefix"] == target
-    }
+    # the mappings for all prefix pairs are indexed at once, so repeated calls are cheap
+    subsets = _get_cached(_SUBSETS_CACHE, TRUE_MAPPINGS_PATH, _read_subsets) or {}
+    return dict(subsets.get((source, target), {}))
+
+
+def _read_subsets(path: Path) -> Dict[Tuple[str, str], Dict[str, str]]:
+    rv: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for mapping in _load_table_shared(path):
+        key = mapping["source prefix"], mapping["target prefix"]
+        rv.setdefault(key, {})[mapping["source identifier"]] = mapping["target identifier"]
+    return rv
 
 
 def append_true_mappings(
@@ -305,8 +495,7 @@ def append_true_mappings(
     """Append new lines to the mappings table."""
     if path is None:
         path = TRUE_MAPPINGS_PATH
-    _write_curated(mappings, path=path, mode="a")
-    if sort:
+    if _write_curated(mappings, path=path, mode="a") and sort:
         lint_true_mappings(path=path)
 
 
@@ -320,8 +509,8 @@ def write_true_mappings(mappings: Mappings, *, path: Optional[Path] = None) -> N
     _write_curated(mappings=mappings, path=path or TRUE_MAPPINGS_PATH, mode="w")
 
 
-def _write_curated(mappings: Mappings, *, path: Path, mode: Literal["w", "a"]):
-    _write_helper(MAPPINGS_HEADER, mappings, path, mode=mode)
+def _write_curated(mappings: Mappings, *, path: Path, mode: Literal["w", "a"]) -> int:
+    return _write_helper(MAPPINGS_HEADER, mappings, path, mode=mode)
 
 
 def lint_true_mappings(*, standardize: bool = False, path: Optional[Path] = None) -> None:
@@ -353,8 +542,7 @@ def append_false_mappings(
     """Append new lines to the false mappings table."""
     if path is None:
         path = FALSE_MAPPINGS_PATH
-    _write_curated(mappings=mappings, path=path, mode="a")
-    if sort:
+    if _write_curated(mappings=mappings, path=path, mode="a") and sort:
         lint_false_mappings(path=path)
 
 
@@ -385,8 +573,7 @@ def append_unsure_mappings(
     """Append new lines to the "unsure" mappings table."""
     if path is None:
         path = UNSURE_PATH
-    _write_curated(mappings, path=path, mode="a")
-    if sort:
+    if _write_curated(mappings, path=path, mode="a") and sort:
         lint_unsure_mappings(path=path)
 
 
@@ -442,25 +629,24 @@ def append_predictions(
     """Append new lines to the predictions table."""
     if standardize:
         mappings = _standardize_mappings(mappings)
+    curated_fingerprints = None
     if deduplicate:
-        existing_mappings = {
-            get_canonical_tuple(existing_mapping)
-            for existing_mapping in itt.chain(
-                load_mappings(),
-                load_false_mappings(),
-                load_unsure(),
-                load_predictions(),
-            )
-        }
-        mappings = (
-            mapping for mapping in mappings if get_canonical_tuple(mapping) not in existing_mappings
+        curated_fingerprints = _get_fingerprints(
+            TRUE_MAPPINGS_PATH, FALSE_MAPPINGS_PATH, UNSURE_PATH
+        )
+        mappings = _remove_fingerprints(
+            mappings, curated_fingerprints, _get_fingerprints(PREDICTIONS_PATH)
         )
 
     if path is None:
         path = PREDICTIONS_PATH
-    _write_helper(PREDICTIONS_HEADER, mappings, path, mode="a")
-    if sort:
-        lint_predictions(path=path)
+    if _write_helper(PREDICTIONS_HEADER, mappings, path, mode="a") and sort:
+        if curated_fingerprints is None:
+            curated_fingerprints = _get_fingerprints(
+                TRUE_MAPPINGS_PATH, FALSE_MAPPINGS_PATH, UNSURE_PATH
+            )
+        # the curated tables haven't changed, so their fingerprints can be reused
+        _lint_predictions(path=path, skip_fingerprints=(curated_fingerprints,))
 
 
 def lint_predictions(
@@ -480,33 +666,83 @@ def lint_predictions(
     :param path: The path to the predicted mappings
     :param additional_curated_mappings: A list of additional mappings
     """
-    mappings = remove_mappings(
-        load_predictions(path=path),
-        itt.chain(
-            load_mappings(),
-            load_false_mappings(),
-            load_unsure(),
-            additional_curated_mappings or [],
-        ),
+    curated_fingerprints = _get_fingerprints(TRUE_MAPPINGS_PATH, FALSE_MAPPINGS_PATH, UNSURE_PATH)
+    curated_fingerprints.update(map(_get_fingerprint, additional_curated_mappings or []))
+    _lint_predictions(
+        standardize=standardize,
+        path=path,
+        skip_fingerprints=(curated_fingerprints,),
+    )
+
+
+def _lint_predictions(
+    *,
+    skip_fingerprints: Sequence[AbstractSet[int]],
+    standardize: bool = False,
+    path: Optional[Path] = None,
+) -> None:
+    """Lint the predictions file, removing mappings with any of the given fingerprints."""
+    # unless the rows get standardized in place, they're only read and don't need copying
+    predictions = (
+        load_predictions(path=path)
+        if standardize
+        else _load_table_shared(path or PREDICTIONS_PATH)
     )
-    mappings = _remove_redundant(mappings, standardize=standardize)
-    mappings = sorted(mappings, key=mapping_sort_key)
+    if standardize:
+        # curated mappings are matched against the predictions as they were before
+        # standardization, so they have to be removed first
+        mappings = _remove_fingerprints(predictions, *skip_fingerprints)
+        mappings = _remove_redundant(mappings, standardize=True)
+    else:
+        mappings = _remove_redundant(predictions, skip_fingerprints=skip_fingerprints)
+    # no need to sort here, since writing sorts the mappings anyway
     write_predictions(mappings, path=path)
 
 
 def remove_mappings(mappings: Mappings, mappings_to_remove: Mappings) -> Mappings:
     """Remove the first set of mappings from the second."""
+    # exact canonical tuples are used here, since fingerprints can collide
     skip_tuples = {get_canonical_tuple(mtr) for mtr in mappings_to_remove}
     return (mapping for mapping in mappings if get_canonical_tuple(mapping) not in skip_tuples)
 
 
-def _remove_redundant(mappings: Mappings, *, standardize: bool = False) -> Mappings:
+def _remove_fingerprints(mappings: Mappings, *skip_fingerprints: AbstractSet[int]) -> Mappings:
+    for mapping in mappings:
+        fingerprint = _get_fingerprint(mapping)
+        if not any(fingerprint in fingerprints for fingerprints in skip_fingerprints):
+            yield mapping
+
+
+def _remove_redundant(
+    mappings: Mappings,
+    *,
+    standardize: bool = False,
+    skip_fingerprints: Sequence[AbstractSet[int]] = (),
+) -> Mappings:
+    """Keep the best mapping for each canonical tuple.
+
+    :param mappings: The mappings to deduplicate
+    :param standardize: Should identifiers be standardized first?
+    :param skip_fingerprints: Sets of fingerprints of mappings to remove. This is done
+        in the same pass, which saves building each canonical tuple twice like a
+        separate :func:`_remove_fingerprints` would.
+    :returns: The best mapping for each canonical tuple
+    """
     if standardize:
         mappings = _standardize_mappings(mappings)
-    dd = defaultdict(list)
+    # keep the best mapping seen so far for each canonical tuple rather than collecting
+    # them all. Like max(), this keeps the first of several equally good mappings
+    best: Dict[CanonicalTuple, Mapping[str, str]] = {}
     for mapping in mappings:
-        dd[get_canonical_tuple(mapping)].append(mapping)
-    return (max(mappings, key=_pick_best) for mappings in dd.values())
+        key = get_canonical_tuple(mapping)
+        if skip_fingerprints:
+            fingerprint = hash(key)
+            if any(fingerprint in fingerprints for fingerprints in skip_fingerprints):
+                continue
+        previous = best.get(key)
+        if previous is None or _pick_best(mapping) > _pick_best(previous):
+            best[key] = mapping
+    return best.values()
 
 
 def _pick_best(mapping: Mapping[str, str]) -> int:
@@ -544,21 +780,29 @@ def _standardize_mapping(mapping):
         ("source prefix", "source identifier"),
         ("target prefix", "target identifier"),
     ]:
-        prefix, identifier = mapping[prefix_key], mapping[identifier_key]
-        resource = bioregistry.get_resource(prefix)
-        if resource is None:
-            raise ValueError
-        miriam_prefix = resource.get_miriam_prefix()
-        if miriam_prefix is None or miriam_prefix in OVERRIDE_MIRIAM:
-            mapping[identifier_key] = resource.standardize_identifier(identifier)
-        else:
-            mapping[identifier_key] = (
-                resource.miriam_standardize_identifier(identifier) or identifier
-            )
+        standardize_identifier = _get_identifier_standardizer(mapping[prefix_key])
+        mapping[identifier_key] = standardize_identifier(mapping[identifier_key])
 
     return mapping
 
 
+@lru_cache(maxsize=None)
+def _get_identifier_standardizer(prefix: str) -> Callable[[str], str]:
+    # looking up the resource and its MIRIAM prefix is the expensive part, and only
+    # needs to be done once per prefix rather than for each mapping
+    resource = bioregistry.get_resource(prefix)
+    if resource is None:
+        raise ValueError
+    miriam_prefix = resource.get_miriam_prefix()
+    if miriam_prefix is None or miriam_prefix in OVERRIDE_MIRIAM:
+        return resource.standardize_identifier
+
+    def _standardize_identifier(identifier: str) -> str:
+        return resource.miriam_standardize_identifier(identifier) or identifier
+
+    return _standardize_identifier
+
+
 CURATORS_PATH = get_resource_file_path("curators.tsv")
 
 
@@ -573,26 +817,32 @@ def filter_predictions(custom_filter: Mapping[str, Mapping[str, Mapping[str, str
     :param custom_filter: A filter 3-dictionary of source prefix to target prefix
         to source identifier to target identifier
     """
-    predictions = load_predictions()
+    # flatten the filter once so each prediction only needs a single lookup
+    skip_quads = {
+        (source_prefix, target_prefix, source_id, target_id)
+        for source_prefix, target_prefix_filter in custom_filter.items()
+        for target_prefix, identifier_filter in target_prefix_filter.items()
+        for source_id, target_id in identifier_filter.items()
+    }
     predictions = [
-        prediction for prediction in predictions if _check_filter(prediction, custom_filter)
+        prediction
+        for prediction in _load_table_shared(PREDICTIONS_PATH)
+        if _get_quad(prediction) not in skip_quads
     ]
     write_predictions(predictions)
 
 
-def _check_filter(
-    prediction: Mapping[str, str],
-    custom_filter: Mapping[str, Mapping[str, Mapping[str, str]]],
-) -> bool:
-    source_prefix, target_prefix = prediction["source prefix"], prediction["target prefix"]
-    source_id, target_id = prediction["source identifier"], prediction["target identifier"]
-    return target_id != custom_filter.get(source_prefix, {}).get(target_prefix, {}).get(source_id)
+_get_quad = itemgetter("source prefix", "target prefix", "source identifier", "target identifier")
 
 
 def get_curated_filter() -> Mapping[str, Mapping[str, Mapping[str, str]]]:
     """Get a filter over all curated mappings."""
     d: DefaultDict[str, DefaultDict[str, Dict[str, str]]] = defaultdict(lambda: defaultdict(dict))
-    for m in itt.chain(load_mappings(), load_false_mappings(), load_unsure()):
+    for m in itt.chain(
+        _load_table_shared(TRUE_MAPPINGS_PATH),
+        _load_table_shared(FALSE_MAPPINGS_PATH),
+        _load_table_shared(UNSURE_PATH),
+    ):
         d[m["source prefix"]][m["target prefix"]][m["source identifier"]] = m["target identifier"]
     return {k: dict(v) for k, v in d.items()}
 
@@ -603,12 +853,40 @@ def prediction_tuples_from_semra(
     confidence: float,
 ) -> List[PredictionTuple]:
     """Get prediction tuples from SeMRA mappings."""
+    import pyobo
+    from pyobo.getters import NoBuild
+
+    mappings = list(mappings)
+    # load each resource's names once up front rather than looking up each entity separately
+    prefixes = {reference.prefix for mapping in mappings for reference in (mapping.s, mapping.o)}
+    names: Dict[str, Mapping[str, str]] = {}
+    for prefix in sorted(prefixes):
+        try:
+            names[prefix] = pyobo.get_id_name_mapping(prefix)
+        except (ValueError, NoBuild):
+            # mappings with unknown or unbuildable prefixes are skipped, without
+            # looking up each of their names
+            names[prefix] = {}
     rows = []
     for mapping in mappings:
         try:
-            row = PredictionTuple.from_semra(mapping, confidence)
+            row = PredictionTuple.from_semra(mapping, confidence, names=names)
         except KeyError as e:
             tqdm.write(str(e))
             continue
         rows.append(row)
     return rows
+
+
+def _get_name(
+    prefix: str, identifier: str, names: Optional[Mapping[str, Mapping[str, str]]] = None
+) -> Optional[str]:
+    if names is not None and prefix in names:
+        prefix_names = names[prefix]
+        name = prefix_names.get(identifier)
+        # an empty dictionary means the prefix's names couldn't be loaded
+        if name or not prefix_names:
+            return name
+    import pyobo
+
+    return pyobo.get_name(prefix, identifier)
@@ -4,6 +4,7 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from subprocess import CalledProcessError, check_output  # noqa: S404
 from typing import Any, Mapping, Optional, Tuple
@@ -247,13 +248,25 @@ def check_valid_prefix_id(prefix: str, identifier: str):
 
 def get_curie(prefix: str, identifier: str, *, preferred: bool = False) -> str:
     """Get a normalized curie from a pre-parsed prefix/identifier pair."""
-    prefix_norm, identifier_norm = bioregistry.normalize_parsed_curie(prefix, identifier)
-    if prefix_norm is None or identifier_norm is None:
+    # this is equivalent to bioregistry.normalize_parsed_curie, but only looks up
+    # each prefix's resource once since there are only a few distinct prefixes
+    resource = _get_normalized_resource(prefix)
+    identifier_norm = resource.standardize_identifier(identifier) if resource else None
+    if resource is None or identifier_norm is None:
         raise ValueError(f"could not normalize {prefix}:{identifier}")
+    prefix_norm = resource.prefix
     if preferred:
         prefix_norm = bioregistry.get_preferred_prefix(prefix_norm) or prefix_norm
     return f"{prefix_norm}:{identifier_norm}"
 
 
+@lru_cache(maxsize=None)
+def _get_normalized_resource(prefix: str) -> Optional[bioregistry.Resource]:
+    prefix_norm = bioregistry.normalize_prefix(prefix)
+    if prefix_norm is None:
+        return None
+    return bioregistry.get_resource(prefix_norm)
+
+
 #: A filter 3-dictionary of source prefix to target prefix to source identifier to target identifier
 CMapping = Mapping[str, Mapping[str, Mapping[str, str]]]
@@ -0,0 +1,168 @@
+"""Tests for the paper analysis."""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+import unittest
+from collections import defaultdict
+from pathlib import Path
+from unittest import mock
+
+import pystow
+from bioregistry import manager
+
+from biomappings import paper_analysis
+from biomappings.paper_analysis import (
+    _json_dumps,
+    _json_loads,
+    _read_index,
+    _write_index,
+    index_mappings,
+)
+
+
+def _index_mappings_by_row(mappings):
+    """Index mappings one at a time, as :func:`index_mappings` originally did."""
+    rv = defaultdict(lambda: defaultdict(dict))
+    for mapping in mappings:
+        source_prefix = mapping["source prefix"]
+        source_resource = manager.registry[source_prefix]
+        source_id = source_resource.standardize_identifier(mapping["source identifier"])
+        target_prefix = mapping["target prefix"]
+        target_resource = manager.registry[target_prefix]
+        target_id = target_resource.standardize_identifier(mapping["target identifier"])
+        rv[source_prefix][target_prefix][source_id] = target_id
+        rv[target_prefix][source_prefix][target_id] = source_id
+    return {k: dict(v) for k, v in rv.items()}
+
+
+class TestIndexMappings(unittest.TestCase):
+    """A test case for indexing mappings."""
+
+    def test_order(self):
+        """Test that later mappings overwrite earlier ones in both directions."""
+        mappings = [
+            # a one-to-many mapping within the same prefix
+            ("wikipathways", "WP1041", "wikipathways", "WP921"),
+            ("wikipathways", "WP1041", "wikipathways", "WP1"),
+            ("wikipathways", "WP1", "wikipathways", "WP2"),
+            # mappings between the same prefixes in both directions
+            ("chebi", "CHEBI:10001", "mesh", "C067604"),
+            ("mesh", "C067604", "chebi", "10002"),
+            ("chebi", "10001", "mesh", "C000001"),
+        ]
+        mappings = [
+            {
+                "source prefix": source_prefix,
+                "source identifier": source_id,
+                "target prefix": target_prefix,
+                "target identifier": target_id,
+            }
+            for source_prefix, source_id, target_prefix, target_id in mappings
+        ]
+        self.assertEqual(_index_mappings_by_row(mappings), index_mappings(mappings))
+
+
+class TestIndexCache(unittest.TestCase):
+    """A test case for reading and writing the cached mapping index."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.directory_path = Path(self.directory.name)
+        # the same objects are reused both across and within the index's items,
+        # which the pickler memoizes
+        shared = {"10001": "C067604"}
+        self.index = {
+            "chebi": {"mesh": shared, "ncit": {"10002": "C1234"}},
+            "mesh": {"chebi": {"C067604": "10001"}, "ncit": shared},
+            "ncit": {"chebi": shared, "mesh": shared},
+        }
+
+    def tearDown(self) -> None:
+        """Clean up the temporary directory."""
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that an index is read back the same as it was written."""
+        path = self.directory_path.joinpath("index.pkl")
+        _write_index(path, self.index)
+        self.assertEqual(self.index, _read_index(path))
+
+    def test_round_trip_gzip(self):
+        """Test that a gzipped index is read back the same as it was written."""
+        path = self.directory_path.joinpath("index.pkl.gz")
+        _write_index(path, self.index)
+        self.assertEqual(self.index, _read_index(path))
+
+    def test_read_legacy(self):
+        """Test reading an index cached as a single pickled dictionary."""
+        path = self.directory_path.joinpath("index.pkl")
+        path.write_bytes(pickle.dumps(self.index))
+        self.assertEqual(self.index, _read_index(path))
+
+
+class TestJSON(unittest.TestCase):
+    """A test case for reading and writing JSON caches."""
+
+    def test_without_orjson(self):
+        """Test that JSON caches can be read and written without :mod:`orjson`."""
+        d = {"version": "1.0", "mappings": {"10001": "C067604"}}
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            self.assertEqual(d, _json_loads(_json_dumps(d)))
+
+
+class TestGraphDocumentCache(unittest.TestCase):
+    """A test case for the cache of parsed ontologies."""
+
+    def setUp(self) -> None:
+        """Set up a temporary evaluation directory with a cached ontology."""
+        self.directory = tempfile.TemporaryDirectory()
+        module = pystow.Module(Path(self.directory.name))
+        self.path = module.join("graphs", name="doid.pkl")
+        self.path.write_bytes(pickle.dumps("v1") + pickle.dumps(("2024-01-01", "graph document")))
+        patcher = mock.patch.object(paper_analysis, "EVALUATION", module)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        """Clean up the temporary directory."""
+        self.directory.cleanup()
+
+    def test_recent_cache(self):
+        """Test that a recently cached ontology is used without looking up its version."""
+        with mock.patch.object(paper_analysis, "_get_current_version") as get_current_version:
+            self.assertEqual(
+                ("2024-01-01", "graph document"), paper_analysis._get_graph_document("doid")
+            )
+        get_current_version.assert_not_called()
+
+    def test_old_cache(self):
+        """Test that an old cached ontology is used if its version hasn't changed."""
+        os.utime(self.path, (0, 0))
+        with mock.patch.object(paper_analysis, "_get_current_version", return_value="v1"):
+            self.assertEqual(
+                ("2024-01-01", "graph document"), paper_analysis._get_graph_document("doid")
+            )
+        self.assertLess(time.time() - self.path.stat().st_mtime, 60)
+
+    def test_changed_version(self):
+        """Test that an outdated cached ontology is parsed again without being loaded."""
+        # the cached document can't be unpickled, so this fails if it's loaded
+        self.path.write_bytes(pickle.dumps("v1") + b"not a pickle")
+        os.utime(self.path, (0, 0))
+        parse_results = mock.Mock(graph_document="new graph document")
+        parse_results.guess_version.return_value = "2024-02-01"
+        bioontologies = mock.Mock()
+        bioontologies.get_obograph_by_prefix.return_value = parse_results
+        with mock.patch.object(
+            paper_analysis, "_get_current_version", return_value="v2"
+        ), mock.patch.dict(sys.modules, {"bioontologies": bioontologies}):
+            self.assertEqual(
+                ("2024-02-01", "new graph document"), paper_analysis._get_graph_document("doid")
+            )
+        with self.path.open("rb") as file:
+            self.assertEqual("v2", pickle.load(file))
+            self.assertEqual(("2024-02-01", "new graph document"), pickle.load(file))
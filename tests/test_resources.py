@@ -0,0 +1,133 @@
+"""Tests for loading and writing the resource tables."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from biomappings.resources import (
+    MAPPINGS_HEADER,
+    _load_table_shared,
+    append_true_mappings,
+    load_mappings,
+    write_true_mappings,
+)
+
+
+def _mapping(target_identifier: str):
+    return {
+        "source prefix": "chebi",
+        "source identifier": "10001",
+        "source name": "Visnadin",
+        "relation": "skos:exactMatch",
+        "target prefix": "mesh",
+        "target identifier": target_identifier,
+        "target name": "visnadin",
+        "type": "semapv:ManualMappingCuration",
+        "source": "orcid:0000-0003-4423-4370",
+        "prediction_type": None,
+        "prediction_source": None,
+        "prediction_confidence": None,
+    }
+
+
+class TestLoadCache(unittest.TestCase):
+    """A test case for the cache of loaded tables."""
+
+    def setUp(self) -> None:
+        """Set up a temporary mappings file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("mappings.tsv")
+        self.path.write_text("\t".join(MAPPINGS_HEADER) + "\n")
+
+    def tearDown(self) -> None:
+        """Clean up the temporary mappings file."""
+        self.directory.cleanup()
+
+    def test_reload_after_write(self):
+        """Test that writing a table invalidates the previously loaded version."""
+        self.assertEqual([], load_mappings(path=self.path))
+        write_true_mappings([_mapping("C067604")], path=self.path)
+        self.assertEqual([_mapping("C067604")], load_mappings(path=self.path))
+        write_true_mappings([_mapping("D000000")], path=self.path)
+        self.assertEqual([_mapping("D000000")], load_mappings(path=self.path))
+
+    def test_shared(self):
+        """Test that shared loads reuse the same mappings until the table is written."""
+        write_true_mappings([_mapping("C067604")], path=self.path)
+        mappings = _load_table_shared(self.path)
+        self.assertEqual([_mapping("C067604")], list(mappings))
+        self.assertIs(mappings, _load_table_shared(self.path))
+        self.assertIsNot(mappings[0], load_mappings(path=self.path)[0])
+        write_true_mappings([_mapping("D000000")], path=self.path)
+        self.assertEqual([_mapping("D000000")], list(_load_table_shared(self.path)))
+
+    def test_missing_optional_columns(self):
+        """Test loading rows that leave off trailing optional columns."""
+        mapping = _mapping("C067604")
+        values = [mapping[key] for key in MAPPINGS_HEADER[:9]]
+        with self.path.open("a") as file:
+            print(*values, sep="\t", file=file)  # noqa:T201
+        self.assertEqual(
+            [dict(zip(MAPPINGS_HEADER[:9], values))],
+            load_mappings(path=self.path),
+        )
+
+    def test_relative_path(self):
+        """Test that relative paths are resolved against the current working directory."""
+        write_true_mappings([_mapping("C067604")], path=self.path)
+        other = Path(self.directory.name).joinpath("other")
+        other.mkdir()
+        write_true_mappings([_mapping("D000000")], path=other.joinpath("mappings.tsv"))
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.directory.name)
+            self.assertEqual([_mapping("C067604")], load_mappings(path="mappings.tsv"))
+            os.chdir(other)
+            self.assertEqual([_mapping("D000000")], load_mappings(path="mappings.tsv"))
+        finally:
+            os.chdir(cwd)
+
+    def test_isolated(self):
+        """Test that modifying loaded mappings doesn't affect later loads."""
+        write_true_mappings([_mapping("C067604")], path=self.path)
+        mappings = load_mappings(path=self.path)
+        mappings[0]["target identifier"] = "D000000"
+        mappings.append(_mapping("D000001"))
+        self.assertEqual([_mapping("C067604")], load_mappings(path=self.path))
+
+
+class TestAppend(unittest.TestCase):
+    """A test case for appending to tables."""
+
+    def setUp(self) -> None:
+        """Set up a temporary mappings file."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("mappings.tsv")
+        write_true_mappings([_mapping("C067604")], path=self.path)
+
+    def tearDown(self) -> None:
+        """Clean up the temporary mappings file."""
+        self.directory.cleanup()
+
+    def test_append_redundant(self):
+        """Test that appending a mapping that's already in the file doesn't change it."""
+        original = self.path.read_text()
+        append_true_mappings([_mapping("C067604")], path=self.path, sort=False)
+        self.assertEqual(original, self.path.read_text())
+
+    def test_append(self):
+        """Test appending a new mapping."""
+        append_true_mappings([_mapping("D000000")], path=self.path)
+        self.assertEqual(
+            [_mapping("C067604"), _mapping("D000000")],
+            load_mappings(path=self.path),
+        )
+
+    def test_append_duplicates(self):
+        """Test that a mapping appended twice in the same batch is only written once."""
+        append_true_mappings([_mapping("D000000"), _mapping("D000000")], path=self.path, sort=False)
+        self.assertEqual(
+            [_mapping("C067604"), _mapping("D000000")],
+            load_mappings(path=self.path),
+        )